@@ -1,5 +1,12 @@
 """PRISMA analysis library for systematic review visualization."""
 
-from . import preprocessing, utils, visualization
+import importlib
 
 __all__ = ["preprocessing", "utils", "visualization"]
+
+
+def __getattr__(name: str):
+    """Import subpackages on first access so importing the package stays cheap."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
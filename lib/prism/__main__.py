@@ -0,0 +1,18 @@
+"""Generate all PRISMA analysis figures in parallel.
+
+Run with ``python -m lib.prism``.
+"""
+
+from . import boxplot, prismadiagram, scatterplot_perf_comparison
+from .utils.utils import run_in_processes
+
+
+def run_all() -> None:
+    """Run the figure entry points concurrently, one worker process each."""
+    run_in_processes(
+        [boxplot.main, prismadiagram.main, scatterplot_perf_comparison.main]
+    )
+
+
+if __name__ == "__main__":
+    run_all()
@@ -1,4 +1,3 @@
-from datetime import datetime
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -6,6 +5,9 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 
+from .utils import utils
+from .utils.utils import create_figure, read_csv_cached
+
 
 def load_data(data_path: Path) -> pd.DataFrame:
     """Load and validate the dataset.
@@ -19,7 +21,7 @@ def load_data(data_path: Path) -> pd.DataFrame:
     Raises:
         ValueError: If required column is missing
     """
-    df = pd.read_csv(data_path)
+    df = read_csv_cached(data_path)
     if "total_data" not in df.columns:
         raise ValueError("Column 'total_data' not found in the CSV file.")
     return df
@@ -34,12 +36,14 @@ def compute_statistics(data: np.ndarray) -> dict:
     Returns:
         Dictionary containing minimum, quartiles, median, and maximum
     """
+    # One quantile call sorts the data once for all five statistics
+    minimum, q1, median, q3, maximum = np.quantile(data, [0.0, 0.25, 0.5, 0.75, 1.0])
     return {
-        "Minimum": np.min(data),
-        "First Quartile": np.percentile(data, 25),
-        "Median": np.median(data),
-        "Third Quartile": np.percentile(data, 75),
-        "Maximum": np.max(data),
+        "Minimum": minimum,
+        "First Quartile": q1,
+        "Median": median,
+        "Third Quartile": q3,
+        "Maximum": maximum,
     }
 
 
@@ -53,13 +57,16 @@ def create_violin_plot(data: np.ndarray, stats: dict) -> plt.Figure:
     Returns:
         Matplotlib figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = create_figure(figsize=(10, 5))
 
     # Generate violin plot with log scale
     sns.violinplot(data=data, ax=ax, log_scale=True, color="lightblue")
 
-    # Add jittered scatter plot
-    sns.stripplot(data=data, ax=ax, jitter=True, size=4, color="black", alpha=0.5)
+    # Add jittered scatter plot, seeded so regenerated figures are reproducible
+    rng = np.random.default_rng(0)
+    jitter = rng.uniform(-0.1, 0.1, data.size)
+    ax.scatter(jitter, data, s=16, c="black", alpha=0.5, linewidths=0)
+    ax.set_xlim(-0.5, 0.5)  # keep seaborn's categorical axis limits
 
     # Annotate statistics
     for label, value in stats.items():
@@ -75,44 +82,39 @@ def create_violin_plot(data: np.ndarray, stats: dict) -> plt.Figure:
 
     # Set labels and title
     ax.set_ylabel("Dataset Sample Size", fontsize=12)
-    plt.title("Violin Plot of Dataset Sample Sizes", fontsize=14)
+    ax.set_title("Violin Plot of Dataset Sample Sizes", fontsize=14)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
-def save_figure(fig: plt.Figure, output_dir: Path):
-    """Save the figure in both SVG and PNG formats.
+def save_figure(fig: plt.Figure, output_dir: Path, formats=("svg", "png")):
+    """Save the figure in the requested formats (SVG and PNG by default).
 
     Args:
         fig: Matplotlib figure object
         output_dir: Directory to save the figures
+        formats: File formats to write
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    base_filename = output_dir / f"violinplot_samplesize_{timestamp}"
-    fig.savefig(f"{base_filename}.svg", format="svg", bbox_inches="tight")
-    fig.savefig(f"{base_filename}.png", format="png", bbox_inches="tight")
-    print(f"Violin plot saved in png and svg: {base_filename}")
+    utils.save_figure(fig, output_dir, "violinplot_samplesize", formats)
 
 
 def main():
     """Main function to generate and save the violin plot."""
-    # Setup paths
-    script_dir = Path(__file__).parent
-    data_path = script_dir.parent / "table1.csv"
-    output_dir = script_dir / "saved_fig"
+    # Setup paths relative to the repository root
+    root_dir = Path(__file__).parents[2]
+    data_path = root_dir / "data" / "table1.csv"
+    output_dir = root_dir / "figures" / "figure4" / "saved_fig"
 
     # Load and process data
     df = load_data(data_path)
-    data = df["total_data"].dropna().astype(float).values
+    data = df["total_data"].to_numpy(dtype=np.float64, na_value=np.nan)
+    data = data[~np.isnan(data)]
     stats = compute_statistics(data)
 
     # Create and save the plot
     fig = create_violin_plot(data, stats)
     save_figure(fig, output_dir)
-    plt.close(fig)
 
 
 if __name__ == "__main__":
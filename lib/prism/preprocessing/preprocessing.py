@@ -2,12 +2,20 @@
 
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
 
+def _to_float(values: pd.Series) -> np.ndarray:
+    """Convert a score column to a float array, accepting comma decimals."""
+    if not pd.api.types.is_numeric_dtype(values):
+        values = values.astype(str).str.replace(",", ".", regex=False)
+    return values.astype(np.float64).to_numpy()
+
+
 def preprocess_performance_data(
     df: pd.DataFrame, score_columns: list, evaluation_column: str, modality_column: str
-) -> Tuple[pd.DataFrame, pd.Series]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """Cleans and filters the DataFrame for performance analysis.
 
     Args:
@@ -17,34 +25,35 @@ def preprocess_performance_data(
         modality_column: The column containing modality information.
 
     Returns:
-        A tuple (processed scores DataFrame, modalities Series).
+        A tuple (scores array of shape (n_studies, len(score_columns)),
+        modalities array).
     """
-    # Drop missing values in key columns
-    df = df.dropna(subset=score_columns + [evaluation_column, modality_column])
-
-    # Filter only AUC-based evaluations
-    df = df[df[evaluation_column].str.contains("AUC", na=False)]
+    # Keep rows with all key columns present and an AUC-based evaluation
+    key_columns = score_columns + [evaluation_column, modality_column]
+    complete = df[key_columns].notna().all(axis=1)
+    is_auc = df[evaluation_column].str.contains("AUC", na=False, regex=False)
+    mask = complete & is_auc
 
-    # Convert numeric columns and handle inconsistencies
-    df[score_columns] = (
-        df[score_columns]
-        .apply(lambda col: col.astype(str).str.replace(",", "."))
-        .astype(float)
-    )
+    # Convert numeric columns into one array; column-major so that each
+    # score column handed to the plotting code is contiguous
+    scores = np.empty((int(mask.sum()), len(score_columns)), order="F")
+    for i, col in enumerate(score_columns):
+        scores[:, i] = _to_float(df.loc[mask, col])
 
-    return df[score_columns], df[modality_column]
+    return scores, df.loc[mask, modality_column].to_numpy()
 
 
-def preprocess_sample_size_data(df: pd.DataFrame) -> pd.Series:
+def preprocess_sample_size_data(df: pd.DataFrame) -> np.ndarray:
     """Extract and clean sample size data.
 
     Args:
         df: The input DataFrame.
 
     Returns:
-        Series containing cleaned sample size data.
+        Float array containing the non-missing sample sizes.
     """
     if "total_data" not in df.columns:
         raise ValueError("Column 'total_data' not found in the CSV file.")
 
-    return df["total_data"].dropna().astype(float)
+    data = df["total_data"].to_numpy(dtype=np.float64, na_value=np.nan)
+    return data[~np.isnan(data)]
@@ -1,102 +1,49 @@
-from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import Sequence
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
-
-def load_csv_file(directory: Path) -> pd.DataFrame:
-    """Loads the first CSV file found in the given directory.
-
-    Args:
-        directory: Path object representing the directory containing the CSV file.
-
-    Returns:
-        A pandas DataFrame containing the data from the CSV.
-
-    Raises:
-        FileNotFoundError: If no CSV files are found.
-    """
-    csv_files = list(directory.glob("*.csv"))
-    if not csv_files:
-        raise FileNotFoundError(f"No CSV files found in {directory}.")
-
-    return pd.read_csv(csv_files[0])
-
-
-def validate_dataframe(df: pd.DataFrame, required_columns: list) -> None:
-    """Validates that the DataFrame contains the required columns.
-
-    Args:
-        df: The DataFrame to check.
-        required_columns: A list of required column names.
-
-    Raises:
-        KeyError: If required columns are missing.
-    """
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        raise KeyError(f"Missing required columns: {', '.join(missing_columns)}")
-
-
-def preprocess_data(
-    df: pd.DataFrame, score_columns: list, evaluation_column: str, modality_column: str
-) -> Tuple[pd.DataFrame, pd.Series]:
-    """Cleans and filters the DataFrame for analysis.
-
-    Args:
-        df: The input DataFrame.
-        score_columns: List of column names that need conversion to float.
-        evaluation_column: The column indicating the evaluation metric.
-        modality_column: The column containing modality information.
-
-    Returns:
-        A tuple (processed scores DataFrame, modalities Series).
-    """
-    # Drop missing values in key columns
-    df = df.dropna(subset=score_columns + [evaluation_column, modality_column])
-
-    # Filter only AUC-based evaluations
-    df = df[df[evaluation_column].str.contains("AUC", na=False)]
-
-    # Convert numeric columns and handle inconsistencies
-    df[score_columns] = (
-        df[score_columns]
-        .apply(lambda col: col.astype(str).str.replace(",", "."))
-        .astype(float)
-    )
-
-    return df[score_columns], df[modality_column]
+from .preprocessing.preprocessing import preprocess_performance_data as preprocess_data
+from .utils.utils import (
+    create_figure,
+    get_timestamp,
+    load_csv_file,
+    validate_dataframe,
+)
 
 
 def plot_performance(
-    unimodality_scores: pd.Series,
-    multimodality_scores: pd.Series,
-    modalities: pd.Series,
+    unimodality_scores: np.ndarray,
+    multimodality_scores: np.ndarray,
+    modalities: np.ndarray,
     save_dir: Path,
+    formats: Sequence[str] = ("svg", "png"),
 ) -> None:
     """Generates and saves a scatter plot comparing unimodal and multimodal AUC scores.
 
     Args:
-        unimodality_scores: A Series of unimodal AUC scores.
-        multimodality_scores: A Series of multimodal AUC scores.
-        modalities: A Series representing the modality types.
+        unimodality_scores: An array of unimodal AUC scores.
+        multimodality_scores: An array of multimodal AUC scores.
+        modalities: An array representing the modality types.
         save_dir: Path object representing the directory where the plot should be saved.
+        formats: File formats to write, e.g. ("png",) to skip the SVG.
     """
-    unique_modalities = modalities.unique()
+    # Map each modality to a tab20 color with one integer gather
+    codes, unique_modalities = pd.factorize(modalities)
     colors = plt.cm.tab20(np.linspace(0, 1, len(unique_modalities)))
-    color_map = dict(zip(unique_modalities, colors))
-    modality_colors = modalities.map(color_map)
+    modality_colors = colors[codes]
 
-    # Compute deltas (multimodal - unimodal)
-    deltas = multimodality_scores - unimodality_scores
+    # Compute deltas (multimodal - unimodal) on plain arrays
+    unimodal = np.asarray(unimodality_scores, dtype=np.float64)
+    multimodal = np.asarray(multimodality_scores, dtype=np.float64)
+    deltas = multimodal - unimodal
     median_difference = np.median(deltas)
 
     # Compute statistics
-    negative_delta_count = (deltas < 0.01).sum()
-    large_improvement_count = (deltas > 0.10).sum()
+    negative_delta_count = int(np.count_nonzero(deltas < 0.01))
+    large_improvement_count = int(np.count_nonzero(deltas > 0.10))
     total_studies = len(unimodality_scores)
 
     # Print statistics
@@ -105,25 +52,26 @@ def plot_performance(
     print(f"Studies with Δ > 0.10 (favoring multimodality): {large_improvement_count}")
 
     # Create scatter plot
-    plt.figure(figsize=(22, 8))
-    plt.scatter(
+    fig, ax = create_figure(figsize=(22, 8))
+    ax.scatter(
         unimodality_scores,
         multimodality_scores,
         c=modality_colors,
         alpha=0.9,
         edgecolors="k",
         linewidth=0.5,
+        rasterized=True,
     )
 
     # Reference lines
-    plt.plot(
+    ax.plot(
         [0.5, 1],
         [0.5, 1],
         color="red",
         linestyle="--",
         label="y = x (Equal Performance)",
     )
-    plt.plot(
+    ax.plot(
         [0.5, 1],
         [0.5 + median_difference, 1 + median_difference],
         color="blue",
@@ -132,17 +80,17 @@ def plot_performance(
     )
 
     # Labels & title
-    plt.title(
+    ax.set_title(
         "Unimodality vs. Multimodality AUC Performance", fontsize=18, fontweight="bold"
     )
-    plt.xlabel("Unimodality AUC", fontsize=14)
-    plt.ylabel("Multimodality AUC", fontsize=14)
-    plt.xlim(0.5, 1)
-    plt.ylim(0.5, 1)
-    plt.grid(alpha=0.5)
+    ax.set_xlabel("Unimodality AUC", fontsize=14)
+    ax.set_ylabel("Multimodality AUC", fontsize=14)
+    ax.set_xlim(0.5, 1)
+    ax.set_ylim(0.5, 1)
+    ax.grid(alpha=0.5)
 
     # Add quadrant labels
-    plt.text(
+    ax.text(
         0.55,
         0.9,
         "Favors Multimodality",
@@ -151,7 +99,7 @@ def plot_performance(
         weight="bold",
         bbox=dict(facecolor="white", edgecolor="green", boxstyle="round,pad=0.5"),
     )
-    plt.text(
+    ax.text(
         0.6,
         0.55,
         "Favors Unimodality",
@@ -161,8 +109,12 @@ def plot_performance(
         bbox=dict(facecolor="white", edgecolor="orange", boxstyle="round,pad=0.5"),
     )
 
-    # Compute modality counts
-    modality_counts = modalities.value_counts()
+    # Compute modality counts from the factorized codes
+    modality_counts = np.bincount(codes, minlength=len(unique_modalities))
+    labels = [
+        f"{modality} ({count})"
+        for modality, count in zip(unique_modalities.tolist(), modality_counts.tolist())
+    ]
 
     # Create legend
     modality_patches = [
@@ -173,13 +125,13 @@ def plot_performance(
             color="w",
             markerfacecolor=color,
             markersize=10,
-            label=f"{modality} ({modality_counts[modality]})",
+            label=label,
         )
-        for modality, color in color_map.items()
+        for label, color in zip(labels, colors)
     ]
 
     # Combine legend entries
-    plt.legend(
+    ax.legend(
         handles=modality_patches
         + [
             plt.Line2D(
@@ -202,23 +154,24 @@ def plot_performance(
 
     # Save the plot
     save_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    plt.savefig(save_dir / f"performance_plot_{timestamp}.png", dpi=900, format="png")
-    plt.savefig(
-        save_dir / f"performance_plot_{timestamp}.svg",
-        format="svg",
-        bbox_inches="tight",
-    )
-
-    plt.close()
+    timestamp = get_timestamp()
+    for fmt in formats:
+        # Only the SVG is cropped to its tight bounding box
+        extra = {"bbox_inches": "tight"} if fmt == "svg" else {}
+        fig.savefig(
+            save_dir / f"performance_plot_{timestamp}.{fmt}",
+            dpi=300,
+            format=fmt,
+            **extra,
+        )
 
 
 def main():
     """Main function to load, process, and visualize the CSV data."""
-    # Setup paths
-    script_dir = Path(__file__).parent
-    data_dir = script_dir.parent
-    save_dir = script_dir / "saved_fig"
+    # Setup paths relative to the repository root
+    root_dir = Path(__file__).parents[2]
+    data_dir = root_dir / "data"
+    save_dir = root_dir / "figures" / "figure3" / "saved_fig"
 
     # Required columns for the analysis
     required_columns = [
@@ -237,7 +190,7 @@ def main():
         )
 
         # Create and save the plot
-        plot_performance(scores.iloc[:, 0], scores.iloc[:, 1], modalities, save_dir)
+        plot_performance(scores[:, 0], scores[:, 1], modalities, save_dir)
 
     except (FileNotFoundError, KeyError, ValueError) as e:
         print(f"Error: {e}")
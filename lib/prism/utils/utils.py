@@ -1,29 +1,187 @@
 """Common utility functions for the PRISMA analysis."""
 
+import functools
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
 
 import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # PyArrow is optional; fall back to the pandas parser
+    pa = pacsv = pq = None
 
-def load_csv_file(directory: Path) -> pd.DataFrame:
+# Dublin Core namespace matplotlib uses for SVG metadata such as "Source"
+_DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+
+# Taken once per run so every figure saved by the process shares a timestamp
+_RUN_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def _require_columns(available: Sequence[str], required: Sequence[str]) -> None:
+    """Raise a KeyError naming every required column missing from ``available``."""
+    missing_columns = [col for col in required if col not in available]
+    if missing_columns:
+        raise KeyError(f"Missing required columns: {', '.join(missing_columns)}")
+
+
+def _source_metadata(mtime_ns: int, size: int) -> Dict[bytes, bytes]:
+    """Build the Parquet schema metadata identifying the source CSV version."""
+    return {
+        b"source_mtime_ns": str(mtime_ns).encode(),
+        b"source_size": str(size).encode(),
+    }
+
+
+def _read_parquet_cache(
+    cache_path: Path, mtime_ns: int, size: int, columns: Optional[List[str]]
+) -> Optional["pa.Table"]:
+    """Read the Parquet cache if it was written from this exact CSV version.
+
+    Returns:
+        The cached table, or None if the cache is missing, stale or unreadable.
+
+    Raises:
+        KeyError: If any of ``columns`` is not in the cached table.
+    """
+    try:
+        schema = pq.read_schema(cache_path)
+        expected = _source_metadata(mtime_ns, size)
+        if any((schema.metadata or {}).get(k) != v for k, v in expected.items()):
+            return None
+        if columns is not None:
+            _require_columns(schema.names, columns)
+        return pq.read_table(cache_path, columns=columns)
+    except (OSError, pa.ArrowException):
+        return None  # Missing, partial or corrupt cache; reparse the CSV
+
+
+def _write_parquet_cache(
+    table: "pa.Table", cache_path: Path, mtime_ns: int, size: int
+) -> None:
+    """Atomically replace the Parquet cache with ``table``.
+
+    The table is written to a temporary file in the same directory and moved
+    into place, so concurrent readers never see a partially written cache.
+    The file gets the usual umask-derived permissions rather than mkstemp's
+    private 0600, so other users of a shared checkout can read it.
+    """
+    metadata = {**(table.schema.metadata or {}), **_source_metadata(mtime_ns, size)}
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f".{cache_path.stem}.", suffix=".parquet"
+        )
+    except OSError:
+        return  # Read-only data directory; parsing the CSV still works
+    os.close(fd)
+    umask = os.umask(0)
+    os.umask(umask)
+    try:
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_name)
+        os.chmod(tmp_name, 0o666 & ~umask)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    usecols: Optional[Tuple[str, ...]] = None,
+) -> pd.DataFrame:
+    """Parse a CSV file once per (path, modification time, size, columns) key.
+
+    With PyArrow available, the CSV is parsed on multiple threads and the
+    columns stay Arrow-backed (``pd.ArrowDtype``). The parsed table is also
+    kept on disk as a sibling ``.parquet`` file tagged with the CSV's
+    modification time and size, which later processes read instead of the CSV
+    while both still match. The cache always holds every column, and
+    ``usecols`` is applied when reading from it. Missing ``usecols`` raise
+    the same KeyError on every path.
+    """
+    columns = list(usecols) if usecols is not None else None
+    if pacsv is None:
+        if columns is None:
+            return pd.read_csv(path_str)
+        df = pd.read_csv(path_str, usecols=lambda name: name in usecols)
+        _require_columns(df.columns, columns)
+        return df[columns]
+
+    cache_path = Path(path_str).with_suffix(".parquet")
+    table = _read_parquet_cache(cache_path, mtime_ns, size, columns)
+    if table is None:
+        read_options = pacsv.ReadOptions(use_threads=True)
+        table = pacsv.read_csv(path_str, read_options=read_options)
+        _write_parquet_cache(table, cache_path, mtime_ns, size)
+        if columns is not None:
+            _require_columns(table.schema.names, columns)
+            table = table.select(columns)
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_csv_cached(
+    path: Path, usecols: Optional[Sequence[str]] = None, memoize: bool = True
+) -> pd.DataFrame:
+    """Read a CSV file, reusing the parsed DataFrame while the file is unchanged.
+
+    Args:
+        path: Path to the CSV file.
+        usecols: Optional subset of columns to load; all columns if None.
+        memoize: Keep the parsed frame in memory for later calls. One-shot
+            callers pass False so the frame is freed once they drop it; the
+            on-disk Parquet cache is used either way.
+
+    Returns:
+        A fresh copy of the parsed DataFrame, safe to modify in place.
+
+    Raises:
+        KeyError: If any of ``usecols`` is not a column of the file.
+    """
+    if usecols is not None:
+        usecols = tuple(usecols)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, usecols)
+    if not memoize:
+        return _read_cached.__wrapped__(*key)
+    return _read_cached(*key).copy()
+
+
+def load_csv_file(
+    directory: Path, usecols: Optional[Sequence[str]] = None, memoize: bool = True
+) -> pd.DataFrame:
     """Loads the first CSV file found in the given directory.
 
     Args:
         directory: Path object representing the directory containing the CSV file.
+        usecols: Optional subset of columns to load; all columns if None.
+        memoize: Keep the parsed frame in memory for later calls (see
+            ``read_csv_cached``).
 
     Returns:
         A pandas DataFrame containing the data from the CSV.
 
     Raises:
         FileNotFoundError: If no CSV files are found.
+        KeyError: If any of ``usecols`` is not a column of the file.
     """
     csv_files = list(directory.glob("*.csv"))
     if not csv_files:
         raise FileNotFoundError(f"No CSV files found in {directory}.")
 
-    return pd.read_csv(csv_files[0])
+    return read_csv_cached(csv_files[0], usecols, memoize)
 
 
 def validate_dataframe(df: pd.DataFrame, required_columns: list) -> None:
@@ -36,25 +194,159 @@ def validate_dataframe(df: pd.DataFrame, required_columns: list) -> None:
     Raises:
         KeyError: If required columns are missing.
     """
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        raise KeyError(f"Missing required columns: {', '.join(missing_columns)}")
+    _require_columns(df.columns, required_columns)
+
+
+def create_figure(
+    figsize: Tuple[float, float], fig: Optional[Figure] = None
+) -> Tuple[Figure, Axes]:
+    """Create a figure with a single axes, bypassing pyplot's global state.
+
+    The figure is attached to an Agg canvas directly, so it is never
+    registered with pyplot and does not need to be closed.
+
+    Args:
+        figsize: Figure size in inches (width, height)
+        fig: Existing figure to clear, resize and reuse instead of allocating
+            a new one
+
+    Returns:
+        A tuple (figure, axes).
+    """
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+    ax = fig.subplots()
+    return fig, ax
 
 
 def get_timestamp() -> str:
-    """Generate a timestamp string for file naming.
+    """Return the timestamp string for file naming.
 
     Returns:
-        A timestamp string in the format YYYYMMDD_HHMMSS.
+        The run's start time as a string in the format YYYYMMDD_HHMMSS.
     """
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return _RUN_TIMESTAMP
 
 
-def save_figure(fig: Any, output_dir: Path, base_filename: str) -> None:
-    """Save a matplotlib figure in both SVG and PNG formats.
+def get_tight_bbox(fig: Figure, pad_inches: float = 0.1) -> Bbox:
+    """Compute the padded tight bounding box of a figure.
+
+    Computing the box once and passing it as ``bbox_inches`` to every
+    ``savefig`` call avoids repeating the layout pass for each output format.
 
     Args:
         fig: Matplotlib figure object
+        pad_inches: Padding around the tight bounding box, in inches
+
+    Returns:
+        The bounding box in inches, suitable for ``savefig(bbox_inches=...)``.
+    """
+    fig.draw_without_rendering()
+    return fig.get_tightbbox().padded(pad_inches)
+
+
+def save_figure(
+    fig: Any,
+    output_dir: Path,
+    base_filename: str,
+    formats: Sequence[str] = ("svg", "png"),
+    max_dpi: float = 150,
+) -> None:
+    """Save a matplotlib figure in the requested formats (SVG and PNG by default).
+
+    Args:
+        fig: Matplotlib figure object
+        output_dir: Directory to save the figures
+        base_filename: Base name for the output files
+        formats: File formats to write, e.g. ("png",) to skip the SVG
+        max_dpi: Upper bound on the resolution of PNG output and of rasterized
+            layers in vector output; figures below it keep their own DPI
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = get_timestamp()
+    full_filename = output_dir / f"{base_filename}_{timestamp}"
+
+    bbox = get_tight_bbox(fig)
+    dpi = min(fig.dpi, max_dpi)
+    for fmt in formats:
+        # Fast DEFLATE for PNG: larger files, but much less time spent compressing
+        extra = {"pil_kwargs": {"compress_level": 1}} if fmt == "png" else {}
+        fig.savefig(
+            f"{full_filename}.{fmt}", format=fmt, bbox_inches=bbox, dpi=dpi, **extra
+        )
+    print(f"Figure saved in {' and '.join(formats)}: {full_filename}")
+
+
+def _read_source_metadata(path: Path) -> Optional[str]:
+    """Read the "Source" metadata field of a saved PNG or SVG file.
+
+    Returns:
+        The field's value, or None if it is absent or the file is unreadable.
+    """
+    try:
+        if path.suffix == ".png":
+            from PIL import Image  # Only needed here; keep it off other imports
+
+            with Image.open(path) as image:
+                return getattr(image, "text", {}).get("Source")
+        element = ElementTree.parse(path).find(f".//{{{_DC_NAMESPACE}}}source")
+        return None if element is None else element.text
+    except (OSError, ElementTree.ParseError):
+        return None
+
+
+def find_saved_figure(
+    output_dir: Path,
+    base_filename: str,
+    source: str,
+    formats: Sequence[str] = ("svg", "png"),
+) -> Optional[Path]:
+    """Find a previously saved figure whose "Source" metadata matches ``source``.
+
+    The metadata is read from the PNG if it is among ``formats``, otherwise
+    from the SVG (its ``dc:source`` element). A match only counts if a file for
+    every requested format exists alongside it with the same timestamp.
+
+    Args:
+        output_dir: Directory the figures were saved to
+        base_filename: Base name of the output files
+        source: Expected value of the "Source" metadata field
+        formats: File formats that must all be present; must include "png"
+            or "svg", the only formats that carry the metadata
+
+    Returns:
+        Path of the first matching PNG or SVG, or None if there is none.
+
+    Raises:
+        ValueError: If ``formats`` includes neither "png" nor "svg".
+    """
+    marker = next((fmt for fmt in ("png", "svg") if fmt in formats), None)
+    if marker is None:
+        raise ValueError(
+            "formats must include 'png' or 'svg' to record the source metadata, "
+            f"got {tuple(formats)}"
+        )
+
+    for path in sorted(output_dir.glob(f"{base_filename}_*.{marker}")):
+        if not all(path.with_suffix(f".{fmt}").exists() for fmt in formats):
+            continue
+        if _read_source_metadata(path) == source:
+            return path
+    return None
+
+
+def save_figure_bytes(
+    rendered: Dict[str, bytes], output_dir: Path, base_filename: str
+) -> None:
+    """Write an already rendered figure to disk, one file per format.
+
+    Args:
+        rendered: Mapping of file format (e.g. "svg", "png") to encoded bytes
         output_dir: Directory to save the figures
         base_filename: Base name for the output files
     """
@@ -63,6 +355,23 @@ def save_figure(fig: Any, output_dir: Path, base_filename: str) -> None:
     timestamp = get_timestamp()
     full_filename = output_dir / f"{base_filename}_{timestamp}"
 
-    fig.savefig(f"{full_filename}.svg", format="svg", bbox_inches="tight")
-    fig.savefig(f"{full_filename}.png", format="png", bbox_inches="tight")
-    print(f"Figure saved in png and svg: {full_filename}")
+    for fmt, data in rendered.items():
+        Path(f"{full_filename}.{fmt}").write_bytes(data)
+    print(f"Figure saved in {' and '.join(rendered)}: {full_filename}")
+
+
+def run_in_processes(entry_points: Sequence[Callable[[], None]]) -> None:
+    """Run independent figure entry points concurrently, one worker process each.
+
+    Building and saving a figure is CPU-bound Python code that holds the GIL,
+    so threads would run the entry points one after another. Entry points must
+    be picklable, e.g. module-level functions or ``functools.partial`` objects
+    wrapping them. Exceptions raised by an entry point are re-raised here.
+
+    Args:
+        entry_points: Zero-argument callables that each generate one figure
+    """
+    with ProcessPoolExecutor(max_workers=len(entry_points)) as executor:
+        futures = [executor.submit(entry_point) for entry_point in entry_points]
+        for future in futures:
+            future.result()
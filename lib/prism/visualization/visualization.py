@@ -1,9 +1,30 @@
 """Visualization functions for the PRISMA analysis."""
 
+import functools
+import hashlib
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import FancyBboxPatch
+
+from ..utils.utils import create_figure, get_tight_bbox
+
+
+@dataclass(slots=True, frozen=True)
+class BoxAnchors:
+    """Anchor points of a diagram box, used as arrow endpoints."""
+
+    center: Tuple[float, float]
+    top: Tuple[float, float]
+    bottom: Tuple[float, float]
+    right: Tuple[float, float]
+    left: Tuple[float, float]
 
 
 def create_box(
@@ -14,7 +35,8 @@ def create_box(
     width: float = 4,
     height: float = 1.8,
     fontsize: int = 10,
-) -> tuple:
+    patches: Optional[List[FancyBboxPatch]] = None,
+) -> BoxAnchors:
     """Create a box with text in the diagram.
 
     Args:
@@ -23,11 +45,13 @@ def create_box(
         x, y: Position coordinates
         width, height: Box dimensions
         fontsize: Font size for the text
+        patches: If given, the box patch is appended here for batched drawing
+            instead of being added to the axis
 
     Returns:
-        Tuple of key positions (center, top-center, bottom-center, right-center, left-center)
+        Anchor points at the center and the middle of each edge of the box
     """
-    box = plt.matplotlib.patches.FancyBboxPatch(
+    box = FancyBboxPatch(
         (x, y),
         width,
         height,
@@ -35,44 +59,61 @@ def create_box(
         edgecolor="black",
         facecolor="white",
     )
-    ax.add_patch(box)
+    if patches is None:
+        ax.add_patch(box)
+    else:
+        patches.append(box)
     ax.text(
         x + width / 2, y + height / 2, text, ha="center", va="center", fontsize=fontsize
     )
 
-    center = (x + width / 2, y + height / 2)
-    top_center = (x + width / 2, y + height)
-    bottom_center = (x + width / 2, y)
-    right_center = (x + width, y + height / 2)
-    left_center = (x, y + height / 2)
-    return center, top_center, bottom_center, right_center, left_center
+    return BoxAnchors(
+        center=(x + width / 2, y + height / 2),
+        top=(x + width / 2, y + height),
+        bottom=(x + width / 2, y),
+        right=(x + width, y + height / 2),
+        left=(x, y + height / 2),
+    )
 
 
+@functools.cache
 def create_prisma_diagram() -> plt.Figure:
     """Create the PRISMA flowchart.
 
+    The diagram has no inputs, so it is built once per process and the same
+    figure is returned on later calls. Callers must not modify it.
+
     Returns:
         Matplotlib figure object containing the PRISMA diagram.
     """
-    fig, ax = plt.subplots(figsize=(12, 16))
+    fig, ax = create_figure(figsize=(12, 16))
     ax.set_xlim(0, 15)
     ax.set_ylim(0, 16)
     ax.axis("off")
 
-    # Create the boxes
+    # Create the boxes, collecting their patches to draw as one collection
     box_positions = {}
+    patches = []
 
     # Identification
     box_positions["identification"] = create_box(
-        ax, "Records identified\nthrough database search\nn = 352", 2, 12
+        ax,
+        "Records identified\nthrough database search\nn = 352",
+        2,
+        12,
+        patches=patches,
     )
     box_positions["duplicates_removed"] = create_box(
-        ax, "Duplicates excluded = 2", 8, 12
+        ax, "Duplicates excluded = 2", 8, 12, patches=patches
     )
 
     # Eligibility
     box_positions["eligibility_title_abstract"] = create_box(
-        ax, "Records screened\nthrough title and abstract\nn = 350", 2, 9.3
+        ax,
+        "Records screened\nthrough title and abstract\nn = 350",
+        2,
+        9.3,
+        patches=patches,
     )
     box_positions["excluded_title_abstract"] = create_box(
         ax,
@@ -84,9 +125,14 @@ def create_prisma_diagram() -> plt.Figure:
         y=6.1,
         width=6,
         height=5,
+        patches=patches,
     )
     box_positions["eligibility_full_text"] = create_box(
-        ax, "Full-text articles\nassessed for eligibility\n(n = 134)", x=2, y=4.2
+        ax,
+        "Full-text articles\nassessed for eligibility\n(n = 134)",
+        x=2,
+        y=4.2,
+        patches=patches,
     )
     box_positions["excluded_full_text"] = create_box(
         ax,
@@ -98,12 +144,14 @@ def create_prisma_diagram() -> plt.Figure:
         y=1,
         width=6,
         height=5,
+        patches=patches,
     )
 
     # Included
     box_positions["included"] = create_box(
-        ax, "Studies included\nin review\nn = 97", 2, 1
+        ax, "Studies included\nin review\nn = 97", 2, 1, patches=patches
     )
+    ax.add_collection(PatchCollection(patches, match_original=True))
 
     # Add arrows
     arrow_properties = dict(arrowstyle="->", color="black", lw=2)
@@ -111,34 +159,34 @@ def create_prisma_diagram() -> plt.Figure:
     # Vertical arrows
     ax.annotate(
         "",
-        xy=box_positions["identification"][2],
-        xytext=box_positions["identification"][2],
+        xy=box_positions["identification"].bottom,
+        xytext=box_positions["identification"].bottom,
         arrowprops=arrow_properties,
     )
     ax.annotate(
         "",
-        xy=box_positions["eligibility_title_abstract"][1],
-        xytext=box_positions["identification"][2],
+        xy=box_positions["eligibility_title_abstract"].top,
+        xytext=box_positions["identification"].bottom,
         arrowprops=arrow_properties,
     )
     ax.annotate(
         "",
-        xy=box_positions["eligibility_full_text"][1],
-        xytext=box_positions["eligibility_title_abstract"][2],
+        xy=box_positions["eligibility_full_text"].top,
+        xytext=box_positions["eligibility_title_abstract"].bottom,
         arrowprops=arrow_properties,
     )
     ax.annotate(
         "",
-        xy=box_positions["included"][1],
-        xytext=box_positions["eligibility_full_text"][2],
+        xy=box_positions["included"].top,
+        xytext=box_positions["eligibility_full_text"].bottom,
         arrowprops=arrow_properties,
     )
 
     # Horizontal arrows
     ax.annotate(
         "",
-        xy=box_positions["duplicates_removed"][4],
-        xytext=box_positions["identification"][3],
+        xy=box_positions["duplicates_removed"].left,
+        xytext=box_positions["identification"].right,
         arrowprops=arrow_properties,
     )
     ax.annotate("", xy=(8, 10), xytext=(6, 10), arrowprops=arrow_properties)
@@ -170,33 +218,82 @@ def create_prisma_diagram() -> plt.Figure:
     return fig
 
 
+def prisma_source_hash() -> str:
+    """Hash the source of this module, which fully determines the PRISMA diagram.
+
+    Returns:
+        A short hexadecimal digest identifying the diagram revision.
+    """
+    return hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=1)
+def _render_prisma_diagram(
+    source_hash: str, formats: Tuple[str, ...]
+) -> Dict[str, bytes]:
+    """Render the PRISMA flowchart to encoded bytes for one source revision."""
+    fig = create_prisma_diagram()
+    bbox = get_tight_bbox(fig)
+    rendered = {}
+    for fmt in formats:
+        # Only PNG and SVG accept a "Source" metadata key
+        metadata = {"Source": source_hash} if fmt in ("png", "svg") else None
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, bbox_inches=bbox, metadata=metadata)
+        rendered[fmt] = buffer.getvalue()
+    return rendered
+
+
+def render_prisma_diagram(formats: Sequence[str] = ("svg", "png")) -> Dict[str, bytes]:
+    """Render the PRISMA flowchart, reusing the output while this module is unchanged.
+
+    The diagram is built entirely from constants, so the encoded figure only
+    needs to be regenerated when its source changes. The source hash is
+    embedded in the "Source" metadata field of PNG and SVG output; other
+    formats are written without it.
+
+    Args:
+        formats: File formats to render
+
+    Returns:
+        Mapping of each requested file format to the encoded figure bytes.
+    """
+    return _render_prisma_diagram(prisma_source_hash(), tuple(formats))
+
+
 def create_performance_plot(
-    unimodality_scores: pd.Series,
-    multimodality_scores: pd.Series,
-    modalities: pd.Series,
+    unimodality_scores: np.ndarray,
+    multimodality_scores: np.ndarray,
+    modalities: np.ndarray,
+    rasterized: bool = True,
+    fig: Optional[plt.Figure] = None,
 ) -> plt.Figure:
     """Create scatter plot comparing unimodal and multimodal performance.
 
     Args:
-        unimodality_scores: Series of unimodal AUC scores
-        multimodality_scores: Series of multimodal AUC scores
-        modalities: Series of modality types
+        unimodality_scores: Array of unimodal AUC scores
+        multimodality_scores: Array of multimodal AUC scores
+        modalities: Array of modality types
+        rasterized: Rasterize the scatter markers so vector output stays small
+        fig: Existing figure to clear and draw into instead of creating one
 
     Returns:
         Matplotlib figure object containing the performance plot
     """
-    unique_modalities = modalities.unique()
+    # Map each modality to a tab20 color with one integer gather
+    codes, unique_modalities = pd.factorize(modalities)
     colors = plt.cm.tab20(np.linspace(0, 1, len(unique_modalities)))
-    color_map = dict(zip(unique_modalities, colors))
-    modality_colors = modalities.map(color_map)
+    modality_colors = colors[codes]
 
-    # Compute deltas (multimodal - unimodal)
-    deltas = multimodality_scores - unimodality_scores
+    # Compute deltas (multimodal - unimodal) on plain arrays
+    unimodal = np.asarray(unimodality_scores, dtype=np.float64)
+    multimodal = np.asarray(multimodality_scores, dtype=np.float64)
+    deltas = multimodal - unimodal
     median_difference = np.median(deltas)
 
     # Compute statistics
-    negative_delta_count = (deltas < 0.01).sum()
-    large_improvement_count = (deltas > 0.10).sum()
+    negative_delta_count = int(np.count_nonzero(deltas < 0.01))
+    large_improvement_count = int(np.count_nonzero(deltas > 0.10))
     total_studies = len(unimodality_scores)
 
     # Print statistics
@@ -205,7 +302,7 @@ def create_performance_plot(
     print(f"Studies with Δ > 0.10 (favoring multimodality): {large_improvement_count}")
 
     # Create scatter plot
-    fig, ax = plt.subplots(figsize=(22, 8))
+    fig, ax = create_figure(figsize=(22, 8), fig=fig)
     ax.scatter(
         unimodality_scores,
         multimodality_scores,
@@ -213,6 +310,7 @@ def create_performance_plot(
         alpha=0.9,
         edgecolors="k",
         linewidth=0.5,
+        rasterized=rasterized,
     )
 
     # Reference lines
@@ -261,8 +359,12 @@ def create_performance_plot(
         bbox=dict(facecolor="white", edgecolor="orange", boxstyle="round,pad=0.5"),
     )
 
-    # Compute modality counts
-    modality_counts = modalities.value_counts()
+    # Compute modality counts from the factorized codes
+    modality_counts = np.bincount(codes, minlength=len(unique_modalities))
+    labels = [
+        f"{modality} ({count})"
+        for modality, count in zip(unique_modalities.tolist(), modality_counts.tolist())
+    ]
 
     # Create legend
     modality_patches = [
@@ -273,9 +375,9 @@ def create_performance_plot(
             color="w",
             markerfacecolor=color,
             markersize=10,
-            label=f"{modality} ({modality_counts[modality]})",
+            label=label,
         )
-        for modality, color in color_map.items()
+        for label, color in zip(labels, colors)
     ]
 
     # Combine legend entries
@@ -303,32 +405,44 @@ def create_performance_plot(
     return fig
 
 
-def create_sample_size_plot(data: pd.Series) -> plt.Figure:
+def create_sample_size_plot(
+    data: np.ndarray, fig: Optional[plt.Figure] = None
+) -> plt.Figure:
     """Create violin plot of dataset sample sizes.
 
     Args:
-        data: Series containing sample size data
+        data: Array containing sample size data
+        fig: Existing figure to clear and draw into instead of creating one
 
     Returns:
         Matplotlib figure object containing the violin plot
     """
-    # Compute key statistics
+    # Imported lazily: seaborn is slow to import and only needed here
+    import seaborn as sns
+
+    data = np.asarray(data, dtype=np.float64)
+
+    # Compute key statistics in a single quantile pass
+    minimum, q1, median, q3, maximum = np.quantile(data, [0.0, 0.25, 0.5, 0.75, 1.0])
     stats = {
-        "Minimum": np.min(data),
-        "First Quartile": np.percentile(data, 25),
-        "Median": np.median(data),
-        "Third Quartile": np.percentile(data, 75),
-        "Maximum": np.max(data),
+        "Minimum": minimum,
+        "First Quartile": q1,
+        "Median": median,
+        "Third Quartile": q3,
+        "Maximum": maximum,
     }
 
     # Create the figure
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig, ax = create_figure(figsize=(10, 5), fig=fig)
 
     # Generate violin plot with log scale
     sns.violinplot(data=data, ax=ax, log_scale=True, color="lightblue")
 
-    # Add jittered scatter plot
-    sns.stripplot(data=data, ax=ax, jitter=True, size=4, color="black", alpha=0.5)
+    # Add jittered scatter plot, seeded so regenerated figures are reproducible
+    rng = np.random.default_rng(0)
+    jitter = rng.uniform(-0.1, 0.1, data.size)
+    ax.scatter(jitter, data, s=16, c="black", alpha=0.5, linewidths=0)
+    ax.set_xlim(-0.5, 0.5)  # keep seaborn's categorical axis limits
 
     # Annotate statistics
     for label, value in stats.items():
@@ -344,7 +458,7 @@ def create_sample_size_plot(data: pd.Series) -> plt.Figure:
 
     # Set labels and title
     ax.set_ylabel("Dataset Sample Size", fontsize=12)
-    plt.title("Violin Plot of Dataset Sample Sizes", fontsize=14)
+    ax.set_title("Violin Plot of Dataset Sample Sizes", fontsize=14)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
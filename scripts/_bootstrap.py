@@ -0,0 +1,10 @@
+"""Shared start-up for the figure generation scripts.
+
+Imported before anything that loads matplotlib, so the non-interactive Agg
+backend is selected up front instead of probing for GUI toolkits. An explicit
+MPLBACKEND in the environment still takes precedence.
+"""
+
+import os
+
+os.environ.setdefault("MPLBACKEND", "Agg")
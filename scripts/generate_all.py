@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Script to generate every figure in parallel, one worker process per figure."""
+
+import argparse
+from functools import partial
+
+import _bootstrap  # noqa: F401  (selects the Agg backend before matplotlib loads)
+import generate_performance_plot
+import generate_prisma
+import generate_sample_size_plot
+
+from lib.prism.utils.utils import run_in_processes
+
+
+def main(graceful: bool = False):
+    """Generate and save all figures concurrently.
+
+    Args:
+        graceful: Print data errors from the performance and sample size
+            plots instead of raising them
+    """
+    run_in_processes(
+        [
+            generate_prisma.main,
+            partial(generate_performance_plot.main, graceful=graceful),
+            partial(generate_sample_size_plot.main, graceful=graceful),
+        ]
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Generate every figure.")
+    parser.add_argument(
+        "--graceful",
+        action="store_true",
+        help="print data errors instead of raising them",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main(graceful=parse_args().graceful)
@@ -1,45 +1,65 @@
 #!/usr/bin/env python3
 """Script to generate the performance comparison plot."""
 
+import argparse
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import _bootstrap  # noqa: F401  (selects the Agg backend before matplotlib loads)
 
 from lib.prism.preprocessing.preprocessing import preprocess_performance_data
 from lib.prism.utils.utils import load_csv_file, save_figure
 from lib.prism.visualization.visualization import create_performance_plot
 
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR.parent / "data"
+OUTPUT_DIR = SCRIPT_DIR.parent / "figures" / "figure3" / "saved_fig"
 
-def main():
-    """Generate and save the performance comparison plot."""
-    # Setup paths
-    script_dir = Path(__file__).parent
-    data_dir = script_dir.parent / "data"
-    output_dir = script_dir.parent / "figures" / "figure3" / "saved_fig"
+# Required columns for the analysis
+REQUIRED_COLUMNS = [
+    "unimodal_best_score",
+    "multimodal_best_score",
+    "evaluation_metric",
+    "modalities",
+]
 
-    # Required columns for the analysis
-    required_columns = [
-        "unimodal_best_score",
-        "multimodal_best_score",
-        "evaluation_metric",
-        "modalities",
-    ]
 
+def main(graceful: bool = False):
+    """Generate and save the performance comparison plot.
+
+    Args:
+        graceful: Print data errors instead of raising them
+    """
     try:
         # Load and process data
-        df = load_csv_file(data_dir)
+        df = load_csv_file(DATA_DIR, usecols=REQUIRED_COLUMNS, memoize=False)
         scores, modalities = preprocess_performance_data(
-            df, required_columns[:2], required_columns[2], required_columns[3]
+            df, REQUIRED_COLUMNS[:2], REQUIRED_COLUMNS[2], REQUIRED_COLUMNS[3]
         )
+        del df  # Only the arrays are needed from here; free the frame before plotting
 
         # Create and save the plot
-        fig = create_performance_plot(scores.iloc[:, 0], scores.iloc[:, 1], modalities)
-        save_figure(fig, output_dir, "performance_plot")
-        plt.close(fig)
+        fig = create_performance_plot(scores[:, 0], scores[:, 1], modalities)
+        save_figure(fig, OUTPUT_DIR, "performance_plot")
 
     except (FileNotFoundError, KeyError, ValueError) as e:
+        if not graceful:
+            raise
         print(f"Error: {e}")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Generate the performance comparison plot."
+    )
+    parser.add_argument(
+        "--graceful",
+        action="store_true",
+        help="print data errors instead of raising them",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    main(graceful=parse_args().graceful)
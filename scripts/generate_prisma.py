@@ -3,22 +3,33 @@
 
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import _bootstrap  # noqa: F401  (selects the Agg backend before matplotlib loads)
 
-from lib.prism.utils.utils import save_figure
-from lib.prism.visualization.visualization import create_prisma_diagram
+from lib.prism.utils.utils import find_saved_figure, save_figure_bytes
+from lib.prism.visualization.visualization import (
+    prisma_source_hash,
+    render_prisma_diagram,
+)
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+OUTPUT_DIR = SCRIPT_DIR.parent / "figures" / "figure1" / "figures"
+# Must include "png" or "svg": the up-to-date check reads the source hash from them
+FORMATS = ("svg", "png")
 
 
 def main():
     """Generate and save the PRISMA diagram."""
-    # Setup paths
-    script_dir = Path(__file__).parent
-    output_dir = script_dir.parent / "figures" / "figure1" / "figures"
-
-    # Create and save the diagram
-    fig = create_prisma_diagram()
-    save_figure(fig, output_dir, "prisma_flowchart")
-    plt.close(fig)
+    # Skip rendering if the current diagram revision was already saved
+    existing = find_saved_figure(
+        OUTPUT_DIR, "prisma_flowchart", prisma_source_hash(), FORMATS
+    )
+    if existing is not None:
+        print(f"PRISMA diagram is up to date: {existing}")
+        return
+
+    # Render and save the diagram
+    save_figure_bytes(render_prisma_diagram(FORMATS), OUTPUT_DIR, "prisma_flowchart")
 
 
 if __name__ == "__main__":
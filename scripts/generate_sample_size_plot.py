@@ -1,35 +1,55 @@
 #!/usr/bin/env python3
 """Script to generate the sample size violin plot."""
 
+import argparse
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+import _bootstrap  # noqa: F401  (selects the Agg backend before matplotlib loads)
 
 from lib.prism.preprocessing.preprocessing import preprocess_sample_size_data
 from lib.prism.utils.utils import load_csv_file, save_figure
 from lib.prism.visualization.visualization import create_sample_size_plot
 
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR.parent / "data"
+OUTPUT_DIR = SCRIPT_DIR.parent / "figures" / "figure4" / "saved_fig"
 
-def main():
-    """Generate and save the sample size violin plot."""
-    # Setup paths
-    script_dir = Path(__file__).parent
-    data_dir = script_dir.parent / "data"
-    output_dir = script_dir.parent / "figures" / "figure4" / "saved_fig"
 
+def main(graceful: bool = False):
+    """Generate and save the sample size violin plot.
+
+    Args:
+        graceful: Print data errors instead of raising them
+    """
     try:
         # Load and process data
-        df = load_csv_file(data_dir)
+        df = load_csv_file(DATA_DIR, usecols=["total_data"], memoize=False)
         data = preprocess_sample_size_data(df)
+        del df  # Only the array is needed from here; free the frame before plotting
 
         # Create and save the plot
         fig = create_sample_size_plot(data)
-        save_figure(fig, output_dir, "violinplot_samplesize")
-        plt.close(fig)
+        save_figure(fig, OUTPUT_DIR, "violinplot_samplesize")
 
     except (FileNotFoundError, KeyError, ValueError) as e:
+        if not graceful:
+            raise
         print(f"Error: {e}")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Generate the sample size violin plot."
+    )
+    parser.add_argument(
+        "--graceful",
+        action="store_true",
+        help="print data errors instead of raising them",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    main()
+    main(graceful=parse_args().graceful)